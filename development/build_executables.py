@@ -6,7 +6,7 @@ Build script to create executable files for all opponent types
 import os
 import sys
 import subprocess
-import shutil
+import importlib.util
 
 # Get the project root directory
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -14,50 +14,97 @@ SRC_DIR = os.path.join(PROJECT_ROOT, "src")
 BUILD_DIR = os.path.join(PROJECT_ROOT, "build")
 EXE_DIR = os.path.join(PROJECT_ROOT, "exe_builds")
 
+# Stable work dir: PyInstaller caches analysis and bytecode between runs,
+# so rebuilds with unchanged sources skip most of the work
+WORK_DIR = os.path.join(PROJECT_ROOT, ".pyinstaller-cache")
+SPEC_PATH = os.path.join(WORK_DIR, "opponents.spec")
+
 # Ensure exe directory exists
 os.makedirs(EXE_DIR, exist_ok=True)
 
-def get_python_executable():
-    """Get the Python executable path"""
-    return "C:/Users/patss/AppData/Local/Programs/Python/Python313/python.exe"
+# Stdlib/third-party modules PyInstaller tends to auto-discover but the
+# engines never import - excluding them shrinks every bundle by several MB,
+# which directly cuts load time each time an engine process starts
+EXCLUDED_MODULES = [
+    "tkinter", "unittest", "pydoc", "xmlrpc", "pdb", "doctest",
+    "distutils", "lib2to3", "test", "email.mime", "http.server",
+    "PIL", "numpy", "matplotlib",
+]
 
-def build_executable(script_name, output_name, is_uci=False):
-    """Build a single executable"""
-    print(f"Building {output_name}...")
-    
-    if is_uci:
-        script_path = os.path.join(SRC_DIR, script_name)
-    else:
+def collect_interactive_targets():
+    """Collect (script_path, output_name) pairs for the interactive builds"""
+    targets = []
+    for script_name, output_name in [
+        ("opening_random_opponent.py", "Interactive_Opening_Random"),
+        ("random_only_opponent.py", "Interactive_Random_Only"),
+        ("elo_400_opponent.py", "Interactive_400_ELO"),
+        ("opening_elo_800_opponent.py", "Interactive_Opening_800_ELO"),
+        ("opening_elo_1200_opponent.py", "Interactive_Opening_1200_ELO"),
+    ]:
         script_path = os.path.join(BUILD_DIR, script_name)
-    
-    if not os.path.exists(script_path):
-        print(f"Warning: {script_path} not found, skipping...")
+        if not os.path.exists(script_path):
+            print(f"Warning: {script_path} not found, skipping...")
+            continue
+        targets.append((script_path, output_name))
+    return targets
+
+def write_spec_file(targets, spec_path):
+    """
+    Generate one spec file covering every executable.
+
+    Each target gets its own independent Analysis/PYZ/EXE/COLLECT block
+    (no MERGE - PyInstaller's multipackage mode only supports onefile
+    executables, and with these onedir bundles it strips the shared
+    libraries the later executables need to launch). The win comes from
+    the single PyInstaller invocation and the shared persistent workpath.
+    """
+    strip = os.name != "nt"
+    lines = [
+        "# -*- mode: python ; coding: utf-8 -*-",
+        "# Generated by build_executables.py - do not edit by hand",
+        f"excludes = {EXCLUDED_MODULES!r}",
+        "",
+    ]
+    for i, (script_path, name) in enumerate(targets):
+        lines += [
+            f"a_{i} = Analysis([{script_path!r}], excludes=excludes)",
+            f"pyz_{i} = PYZ(a_{i}.pure)",
+            f"exe_{i} = EXE(pyz_{i}, a_{i}.scripts, [], exclude_binaries=True, "
+            f"name={name!r}, debug=False, strip={strip}, upx=False, console=True)",
+            f"coll_{i} = COLLECT(exe_{i}, a_{i}.binaries, a_{i}.datas, "
+            f"strip={strip}, upx=False, name={name!r})",
+        ]
+    with open(spec_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+def build_executables(targets):
+    """Build every target with a single PyInstaller invocation"""
+    if not targets:
+        print("Nothing to build")
         return False
-    
-    output_path = os.path.join(EXE_DIR, output_name)
-    
+
+    os.makedirs(WORK_DIR, exist_ok=True)
+    write_spec_file(targets, SPEC_PATH)
+
     cmd = [
-        get_python_executable(),
+        sys.executable,
         "-m", "PyInstaller",
-        "--onefile",
-        "--console",
+        "--noconfirm",
         "--distpath", EXE_DIR,
-        "--workpath", os.path.join(PROJECT_ROOT, "temp_build"),
-        "--specpath", os.path.join(PROJECT_ROOT, "temp_build"),
-        "--name", output_name,
-        script_path
+        "--workpath", WORK_DIR,
+        SPEC_PATH,
     ]
-    
+
     try:
         subprocess.run(cmd, check=True, cwd=PROJECT_ROOT)
-        print(f"Successfully built {output_name}.exe")
+        print(f"Successfully built {len(targets)} executables")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Failed to build {output_name}: {e}")
+        print(f"Build failed: {e}")
         return False
 
-def create_uci_executables():
-    """Create UCI executables for each opponent type"""
+def collect_uci_targets():
+    """Write UCI wrapper scripts and collect their build targets"""
     opponent_types = [
         ("opening_only_random", "OpponentEngine_Opening_Random"),
         ("random_only", "OpponentEngine_Random_Only"),
@@ -65,8 +112,9 @@ def create_uci_executables():
         ("opening_plus_elo_800", "OpponentEngine_Opening_800_ELO"),
         ("opening_plus_elo_1200", "OpponentEngine_Opening_1200_ELO")
     ]
-    
+
     # Create wrapper scripts for each opponent type
+    targets = []
     for opponent_type, exe_name in opponent_types:
         wrapper_content = f'''#!/usr/bin/env python3
 """
@@ -83,45 +131,32 @@ if __name__ == "__main__":
     uci_engine = UCIOpponentEngine(OpponentType("{opponent_type}"))
     uci_engine.run()
 '''
-        
+
         wrapper_path = os.path.join(BUILD_DIR, f"uci_{opponent_type}.py")
         with open(wrapper_path, 'w') as f:
             f.write(wrapper_content)
-        
-        # Build the executable
-        build_executable(f"uci_{opponent_type}.py", exe_name, is_uci=False)
+
+        targets.append((wrapper_path, exe_name))
+    return targets
 
 def main():
     """Main build function"""
     print("Building Opponent Engine Executables")
     print("=" * 50)
     
-    # Check if PyInstaller is available
-    try:
-        subprocess.run([get_python_executable(), "-c", "import PyInstaller"], 
-                      check=True, capture_output=True)
-    except subprocess.CalledProcessError:
+    # Check if PyInstaller is available - find_spec is an in-process
+    # lookup, no interpreter subprocess needed just to test an import
+    if importlib.util.find_spec("PyInstaller") is None:
         print("PyInstaller not found. Installing...")
-        subprocess.run([get_python_executable(), "-m", "pip", "install", "pyinstaller"], 
+        subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"],
                       check=True)
     
-    # Build interactive versions
-    print("\nBuilding interactive versions...")
-    build_executable("opening_random_opponent.py", "Interactive_Opening_Random", is_uci=False)
-    build_executable("random_only_opponent.py", "Interactive_Random_Only", is_uci=False)
-    build_executable("elo_400_opponent.py", "Interactive_400_ELO", is_uci=False)
-    build_executable("opening_elo_800_opponent.py", "Interactive_Opening_800_ELO", is_uci=False)
-    build_executable("opening_elo_1200_opponent.py", "Interactive_Opening_1200_ELO", is_uci=False)
-    
-    # Build UCI versions for tournament play
-    print("\nBuilding UCI tournament versions...")
-    create_uci_executables()
-    
-    # Clean up temporary files
-    temp_build_dir = os.path.join(PROJECT_ROOT, "temp_build")
-    if os.path.exists(temp_build_dir):
-        shutil.rmtree(temp_build_dir)
-    
+    # One PyInstaller run covers the interactive and UCI versions, sharing
+    # the cached analysis in WORK_DIR across targets and rebuilds
+    print("\nBuilding interactive and UCI tournament versions...")
+    targets = collect_interactive_targets() + collect_uci_targets()
+    build_executables(targets)
+
     print(f"\nBuild complete! Executables are in: {EXE_DIR}")
     print("\nAvailable executables:")
     print("Interactive versions (for testing):")
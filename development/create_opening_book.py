@@ -5,133 +5,263 @@ Analyzes PGN files to extract opening positions and moves for the opening book
 """
 
 import os
+import re
+import mmap
 import chess
-import chess.pgn
+import chess.polyglot
 import json
-from collections import defaultdict
+import struct
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import sys
 
-def extract_openings_from_pgn(pgn_file_path, max_moves=8):
+# SAN move tokens: castling or piece/pawn moves with optional capture,
+# promotion and check/mate suffix. Move numbers and results don't match.
+SAN_TOKEN = rb"O-O(?:-O)?|[KQRBN]?[a-h]?[1-8]?x?[a-h][1-8](?:=[QRBN])?[+#]?"
+
+# Movetext scanner: whole {...} comments and variation parentheses match
+# as single tokens so annotated games can be skipped over lazily instead
+# of their side lines being mistaken for mainline moves
+MOVETEXT_TOKEN_RE = re.compile(rb"\{[^}]*\}|[()]|" + SAN_TOKEN)
+
+# Blank-line boundary between a game's header block and its movetext
+BLANK_LINE_RE = re.compile(rb"\r?\n\s*\r?\n")
+
+# Player ratings, scanned straight off the undecoded header bytes
+ELO_RE = re.compile(rb'\[(?:White|Black)Elo "(\d+)"\]')
+
+def iter_mainline_san(movetext, max_moves):
+    """
+    Lazily yield up to max_moves mainline SAN tokens from movetext.
+
+    Comments are skipped whole and anything inside variation parentheses
+    is ignored; scanning stops as soon as the ply cap is reached, so the
+    bulk of each game's movetext is never tokenized.
+    """
+    yielded = 0
+    depth = 0
+    for match in MOVETEXT_TOKEN_RE.finditer(movetext):
+        token = match.group()
+        first = token[:1]
+        if first == b'{':
+            continue
+        if first == b'(':
+            depth += 1
+            continue
+        if first == b')':
+            depth = max(depth - 1, 0)
+            continue
+        if depth == 0:
+            yield token.decode('ascii')
+            yielded += 1
+            if yielded >= max_moves:
+                return
+
+def iter_games_headers_and_movetext(buf):
+    """
+    Yield (headers, movetext) bytes pairs for each game in a PGN buffer.
+
+    Splits games on the blank-line boundaries between header and movetext
+    blocks by scanning raw bytes (buf is typically an mmap), instead of
+    going through chess.pgn.read_game, which builds a full Game/GameNode
+    tree per game even when only the first few plies are wanted. Nothing
+    is decoded here; callers decode only the slices they need.
+    """
+    pos = 0
+    size = len(buf)
+    while pos < size:
+        boundary = BLANK_LINE_RE.search(buf, pos)
+        if boundary is None:
+            break
+        headers = buf[pos:boundary.start()]
+        move_start = boundary.end()
+        boundary = BLANK_LINE_RE.search(buf, move_start)
+        if boundary is None:
+            yield headers, buf[move_start:]
+            break
+        yield headers, buf[move_start:boundary.start()]
+        pos = boundary.end()
+
+def extract_openings_from_pgn(pgn_file_path, max_moves=8, min_elo=None):
     """
     Extract opening moves from a PGN file
-    
+
     Args:
         pgn_file_path: Path to the PGN file
         max_moves: Maximum number of moves to extract from each game
-        
+        min_elo: If set, only keep games where both players have an Elo
+                 header at or above this rating
+
     Returns:
-        Dictionary mapping positions to lists of moves
+        Tuple of (move counters keyed by Zobrist hash, hash-to-EPD map)
     """
-    openings = defaultdict(set)
-    
+    # Accumulate move frequencies under the 64-bit Zobrist key - int hashing
+    # beats FEN string construction plus string hashing per ply. The reverse
+    # map renders each unique position to its EPD exactly once for the output.
+    openings = defaultdict(Counter)
+    key_to_epd = {}
+
     try:
-        with open(pgn_file_path, 'r', encoding='utf-8', errors='ignore') as pgn_file:
+        if os.path.getsize(pgn_file_path) == 0:
+            return {}, {}
+        with open(pgn_file_path, 'rb') as pgn_file, \
+                mmap.mmap(pgn_file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
             game_count = 0
-            while True:
-                try:
-                    game = chess.pgn.read_game(pgn_file)
-                    if game is None:
+            board = chess.Board()  # one board for the whole file, reset per game
+            for headers, movetext in iter_games_headers_and_movetext(buf):
+                # Filter on the raw header bytes before any SAN work -
+                # filtered-out games are never tokenized at all
+                if min_elo is not None:
+                    elos = [int(m.group(1)) for m in ELO_RE.finditer(headers)]
+                    if len(elos) < 2 or min(elos) < min_elo:
+                        continue
+
+                board.reset()
+
+                # Analyze the opening moves
+                for token in iter_mainline_san(movetext, max_moves):
+                    # Key the position before the move
+                    position_key = chess.polyglot.zobrist_hash(board)
+                    if position_key not in key_to_epd:
+                        # EPD keeps side to move, castling and en passant -
+                        # placement-only keys silently merged white-to-move
+                        # and black-to-move positions with identical pieces
+                        key_to_epd[position_key] = board.epd()
+
+                    # Apply the move and record it for this position
+                    try:
+                        move = board.push_san(token)
+                    except (chess.IllegalMoveError, chess.AmbiguousMoveError,
+                            chess.InvalidMoveError):
+                        # Malformed game - keep what parsed, skip the rest
                         break
-                    
-                    board = game.board()
-                    moves_analyzed = 0
-                    
-                    # Analyze the opening moves
-                    for move in game.mainline_moves():
-                        if moves_analyzed >= max_moves:
-                            break
-                            
-                        # Get the position before the move
-                        position_fen = board.fen().split(' ')[0]  # Just the position part
-                        
-                        # Record this move as a possibility for this position
-                        openings[position_fen].add(move.uci())
-                        
-                        # Make the move
-                        board.push(move)
-                        moves_analyzed += 1
-                    
-                    game_count += 1
-                    if game_count % 100 == 0:
-                        print(f"Processed {game_count} games from {os.path.basename(pgn_file_path)}")
-                        
-                except Exception as e:
-                    # Skip problematic games
-                    continue
-                    
+                    openings[position_key][move.uci()] += 1
+
+                game_count += 1
+                if game_count % 100 == 0:
+                    print(f"Processed {game_count} games from {os.path.basename(pgn_file_path)}")
+
     except Exception as e:
         print(f"Error reading {pgn_file_path}: {e}")
-        return {}
-    
-    # Convert sets to lists
-    return {pos: list(moves) for pos, moves in openings.items()}
+        return {}, {}
 
-def process_all_pgn_files(pgn_directory, output_file):
+    # Values stay Counters so callers can rank moves by how often they
+    # were actually played; keys stay Zobrist hashes for the binary book
+    return dict(openings), key_to_epd
+
+def process_all_pgn_files(pgn_directory, output_file, min_elo=None):
     """
     Process all PGN files in a directory and create comprehensive opening book
     """
-    all_openings = defaultdict(set)
-    
+    all_openings = {}
+    key_to_epd = {}
+
     # Get list of PGN files
     pgn_files = [f for f in os.listdir(pgn_directory) if f.endswith('.pgn')]
-    
+    pgn_paths = [os.path.join(pgn_directory, f) for f in pgn_files]
+
     print(f"Found {len(pgn_files)} PGN files to process...")
-    
-    for i, pgn_file in enumerate(pgn_files, 1):
-        print(f"\nProcessing {i}/{len(pgn_files)}: {pgn_file}")
-        pgn_path = os.path.join(pgn_directory, pgn_file)
-        
-        file_openings = extract_openings_from_pgn(pgn_path, max_moves=10)
-        
-        # Merge with all openings
-        for position, moves in file_openings.items():
-            all_openings[position].update(moves)
-        
-        print(f"  Extracted {len(file_openings)} positions")
+
+    # Each file extracts independently (pure function -> dict) and SAN
+    # parsing is CPU-bound, so fan the files out across processes
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(partial(extract_openings_from_pgn, max_moves=10, min_elo=min_elo), pgn_paths)
+        for i, (pgn_file, (file_openings, file_epds)) in enumerate(zip(pgn_files, results), 1):
+            print(f"Processed {i}/{len(pgn_files)}: {pgn_file}")
+
+            # Merge with all openings - adopt the worker's Counter outright
+            # for unseen positions (the common case across shards) instead
+            # of element-copying into a fresh one
+            for position, moves in file_openings.items():
+                existing = all_openings.get(position)
+                if existing is None:
+                    all_openings[position] = moves
+                else:
+                    existing.update(moves)
+            key_to_epd.update(file_epds)
+
+            print(f"  Extracted {len(file_openings)} positions")
     
     # Convert to final format and sort by popularity
     final_openings = {}
     for position, moves in all_openings.items():
-        # Limit to most common moves (max 6 per position to avoid too much branching)
-        move_list = list(moves)
-        if len(move_list) > 6:
-            move_list = move_list[:6]
-        final_openings[position] = move_list
-    
-    # Save to JSON file
+        # Keep the most played moves (max 6 per position to avoid too much branching)
+        final_openings[key_to_epd[position]] = [move for move, _ in moves.most_common(6)]
+
+    # Save to JSON file - compact separators and no indent keep the C
+    # encoder on its fast path and roughly third the file size; sorted
+    # keys keep the output reproducible across runs
     with open(output_file, 'w') as f:
-        json.dump(final_openings, f, indent=2, sort_keys=True)
-    
+        json.dump(final_openings, f, separators=(',', ':'), sort_keys=True)
+
+    # Save the same data as a binary Polyglot book - 16 bytes per entry,
+    # mmap-binary-searchable by consumers with no parse step at startup
+    bin_file = os.path.splitext(output_file)[0] + '.bin'
+    write_polyglot_book(all_openings, key_to_epd, bin_file)
+
     print(f"\nOpening book created with {len(final_openings)} positions")
     print(f"Saved to: {output_file}")
-    
+    print(f"Polyglot book saved to: {bin_file}")
+
     return final_openings
 
-def add_essential_openings(openings_dict):
+_POLYGLOT_PROMOTION = {None: 0, chess.KNIGHT: 1, chess.BISHOP: 2,
+                       chess.ROOK: 3, chess.QUEEN: 4}
+
+def write_polyglot_book(openings, key_to_epd, output_path):
     """
-    Add some essential opening positions that might be missing
+    Write move counters to a standard Polyglot .bin book.
+
+    Entries are 16 bytes (key, move, weight, learn) sorted by Zobrist key
+    so readers like chess.polyglot can binary-search an mmap of the file.
+    Castling is stored king-takes-rook per the Polyglot convention.
     """
+    entries = []
+    for key, moves in openings.items():
+        base = chess.BaseBoard(key_to_epd[key].split(' ')[0])
+        for uci, count in moves.items():
+            move = chess.Move.from_uci(uci)
+            to_square = move.to_square
+            piece = base.piece_at(move.from_square)
+            if (piece is not None and piece.piece_type == chess.KING
+                    and abs(chess.square_file(move.from_square) - chess.square_file(to_square)) == 2):
+                # Castling: remap the king's destination to the rook square
+                rook_file = 7 if chess.square_file(to_square) == 6 else 0
+                to_square = chess.square(rook_file, chess.square_rank(to_square))
+            move16 = (to_square | (move.from_square << 6)
+                      | (_POLYGLOT_PROMOTION[move.promotion] << 12))
+            entries.append((key, move16, min(count, 0xFFFF)))
+
+    entries.sort()
+    with open(output_path, 'wb') as f:
+        for key, move16, weight in entries:
+            f.write(struct.pack(">QHHI", key, move16, weight, 0))
+
+# Essential opening positions that should always have book moves
+ESSENTIAL_OPENINGS = {
     # Starting position
-    start_pos = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
-    if start_pos not in openings_dict:
-        openings_dict[start_pos] = []
-    openings_dict[start_pos].extend(["e2e4", "d2d4", "g1f3", "c2c4", "b1c3"])
-    openings_dict[start_pos] = list(set(openings_dict[start_pos]))  # Remove duplicates
-    
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq -":
+        ["e2e4", "d2d4", "g1f3", "c2c4", "b1c3"],
     # Essential e4 responses
-    after_e4 = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR"
-    if after_e4 not in openings_dict:
-        openings_dict[after_e4] = []
-    openings_dict[after_e4].extend(["e7e5", "c7c5", "e7e6", "c7c6", "d7d6", "g8f6"])
-    openings_dict[after_e4] = list(set(openings_dict[after_e4]))
-    
-    # Essential d4 responses  
-    after_d4 = "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR"
-    if after_d4 not in openings_dict:
-        openings_dict[after_d4] = []
-    openings_dict[after_d4].extend(["d7d5", "g8f6", "c7c6", "e7e6", "c7c5", "f7f5"])
-    openings_dict[after_d4] = list(set(openings_dict[after_d4]))
-    
+    "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq -":
+        ["e7e5", "c7c5", "e7e6", "c7c6", "d7d6", "g8f6"],
+    # Essential d4 responses
+    "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq -":
+        ["d7d5", "g8f6", "c7c6", "e7e6", "c7c5", "f7f5"],
+}
+
+def add_essential_openings(openings_dict):
+    """
+    Add some essential opening positions that might be missing
+    """
+    for position, essentials in ESSENTIAL_OPENINGS.items():
+        existing = openings_dict.setdefault(position, [])
+        # Append only what's missing - keeps the frequency ranking of the
+        # extracted moves instead of scrambling order via list(set(...))
+        seen = set(existing)
+        existing.extend(move for move in essentials if move not in seen)
+
     return openings_dict
 
 def main():
@@ -155,7 +285,7 @@ def main():
     
     # Save final version
     with open(output_file, 'w') as f:
-        json.dump(openings, f, indent=2, sort_keys=True)
+        json.dump(openings, f, separators=(',', ':'), sort_keys=True)
     
     print(f"\nFinal opening book saved with {len(openings)} positions")
     
@@ -171,7 +301,7 @@ def main():
     sample_count = 0
     for position, moves in list(openings.items())[:5]:
         try:
-            board = chess.Board(position + " w - - 0 1")
+            board = chess.Board(position + " 0 1")
             print(f"\nPosition: {board.fen()}")
             print(f"Moves: {', '.join(moves)}")
             sample_count += 1
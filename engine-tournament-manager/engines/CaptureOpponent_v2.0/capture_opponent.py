@@ -30,11 +30,13 @@ Standalone version - all template code embedded for independence.
 """
 
 import sys
+import array
 import chess
 import random
 import time
+import concurrent.futures
+import numpy as np
 from typing import Optional, Dict, List, Tuple
-from dataclasses import dataclass
 from enum import Enum
 
 # ============================================================================
@@ -52,9 +54,14 @@ MOVE_ORDERING_VALUES = {
     chess.KING: 0
 }
 
+# Capture-victim ordering scores indexed by piece type (None/KING -> 0)
+VICTIM_SCORE = (0, 100, 300, 300, 500, 900, 0)
+
 # Search and evaluation constants - can be customized
 MAX_QUIESCENCE_DEPTH = 8
+DELTA_MARGIN = 200  # Quiescence delta pruning slack (centipawns)
 MATE_SCORE = 30000
+INF = 10**9  # Effectively infinite score bound; all scores stay int and fit int32
 CHECKMATE_BONUS = 900000
 CHECK_BONUS = 500000
 CAPTURE_BONUS = 400000
@@ -62,20 +69,81 @@ KILLER_BONUS = 300000
 PROMOTION_BONUS = 200000
 PAWN_ADVANCE_BONUS = 100000
 
+# Pawn-advance ordering bonuses indexed by [color][to_square]
+# (color indexes follow chess.COLORS: 0 = black, 1 = white)
+PAWN_ADVANCE = [[0] * 64 for _ in range(2)]
+for _sq in range(64):
+    _rank = _sq >> 3
+    if _rank >= 5:
+        PAWN_ADVANCE[chess.WHITE][_sq] = PAWN_ADVANCE_BONUS + _rank * 1000
+    if _rank <= 2:
+        PAWN_ADVANCE[chess.BLACK][_sq] = PAWN_ADVANCE_BONUS + (7 - _rank) * 1000
+del _sq, _rank
+
+# Zobrist keys, generated once at import with a dedicated seeded RNG.
+# Engines used to regenerate ~800 keys per construction (and per ucinewgame,
+# which rebuilds the engine) while also reseeding the global random module;
+# shared module-level tables remove both. Piece keys live in a flat tuple
+# indexed by square * 12 + (piece_type - 1) * 2 + color.
+_ZOBRIST_RNG = random.Random(12345)
+ZOBRIST_PIECES = tuple(_ZOBRIST_RNG.getrandbits(64) for _ in range(64 * 6 * 2))
+ZOBRIST_CASTLING = tuple(_ZOBRIST_RNG.getrandbits(64) for _ in range(4))
+ZOBRIST_EP = tuple(_ZOBRIST_RNG.getrandbits(64) for _ in range(8))
+ZOBRIST_SIDE_TO_MOVE = _ZOBRIST_RNG.getrandbits(64)
+
 class NodeType(Enum):
     EXACT = 0
     LOWER_BOUND = 1
     UPPER_BOUND = 2
 
-@dataclass
-class TTEntry:
-    """Transposition table entry"""
-    zobrist_key: int
-    depth: int
-    value: float
-    node_type: NodeType
-    best_move: Optional[chess.Move]
-    age: int
+# Transposition table entry layout - one fixed-size record per slot instead
+# of a Python object per entry (~16 B vs ~200 B), indexed by hash & mask
+TT_DTYPE = np.dtype([
+    ('key', np.uint64),
+    ('depth', np.int16),
+    ('value', np.int32),
+    ('flag', np.uint8),
+    ('move', np.uint16),
+    ('age', np.uint16),
+])
+
+def _material_score(pawns: int, knights: int, bishops: int, rooks: int,
+                    queens: int, white: int, black: int,
+                    vp: int, vn: int, vb: int, vr: int, vq: int) -> int:
+    """
+    Material balance (white minus black) over raw bitboard integers.
+
+    Pure integer arithmetic with no chess.Board access, so the hot leaf
+    evaluation is a single JIT-compilable kernel (numba @njit would accept
+    this signature unchanged). The shipped engines stay stdlib+python-chess
+    for the PyInstaller builds, so no JIT dependency is taken by default.
+    """
+    return (((pawns & white).bit_count() - (pawns & black).bit_count()) * vp
+            + ((knights & white).bit_count() - (knights & black).bit_count()) * vn
+            + ((bishops & white).bit_count() - (bishops & black).bit_count()) * vb
+            + ((rooks & white).bit_count() - (rooks & black).bit_count()) * vr
+            + ((queens & white).bit_count() - (queens & black).bit_count()) * vq)
+
+
+def _search_root_move(engine_cls, fen: str, move_uci: str, depth: int,
+                      alpha: int, beta: int, time_budget: float) -> Tuple[str, int, int]:
+    """
+    Worker-process entry point for root-split search.
+
+    Builds a fresh engine (own TT, killers, history), applies one root move
+    and searches the resulting position. Workers do not share state, so this
+    trades some re-search against GIL-free parallelism at the root only.
+    """
+    engine = engine_cls()
+    board = chess.Board(fen)
+    engine.board = board
+    engine.start_time = time.time()
+    engine.time_limit = time_budget
+    engine._seed_search_state(board)
+    engine._do_move(board, chess.Move.from_uci(move_uci))
+    value, _ = engine._search(board, depth - 1, -beta, -alpha, 1)
+    return move_uci, -value, engine.nodes_searched
+
 
 class ChessEngineTemplate:
     """
@@ -150,78 +218,163 @@ class ChessEngineTemplate:
         self.start_time = 0
         self.time_limit = 0
         self.nodes_searched = 0
+        self._time_up_cached = False
         self.age = 0
         
-        # Transposition table
-        self.tt_size = (tt_size_mb * 1024 * 1024) // 64  # Approximate entries
-        self.transposition_table: Dict[int, TTEntry] = {}
-        
-        # Move ordering tables
-        self.killer_moves: List[List[Optional[chess.Move]]] = [[None, None] for _ in range(64)]
-        self.history_table: Dict[Tuple[chess.Square, chess.Square], int] = {}
-        
-        # Zobrist keys for hashing
-        self._init_zobrist()
-        
-    def _init_zobrist(self):
-        """Initialize Zobrist hashing keys"""
-        random.seed(12345)  # Fixed seed for reproducibility
-        self.zobrist_pieces = {}
-        self.zobrist_castling = {}
-        self.zobrist_en_passant = {}
-        self.zobrist_side_to_move = random.getrandbits(64)
-        
-        # Piece-square zobrist keys
-        for square in chess.SQUARES:
-            for piece in chess.PIECE_TYPES:
-                for color in chess.COLORS:
-                    self.zobrist_pieces[(square, piece, color)] = random.getrandbits(64)
-        
-        # Castling rights
-        for i in range(4):  # 4 castling rights (WK, WQ, BK, BQ)
-            self.zobrist_castling[i] = random.getrandbits(64)
-            
-        # En passant file
-        for file in range(8):
-            self.zobrist_en_passant[file] = random.getrandbits(64)
-    
-    def _get_zobrist_key(self, board: chess.Board) -> int:
-        """Calculate Zobrist hash for current position"""
+        # Transposition table - power-of-two direct-mapped struct array
+        requested_entries = (tt_size_mb * 1024 * 1024) // TT_DTYPE.itemsize
+        self.tt_size = 1 << max(10, requested_entries.bit_length() - 1)
+        self.tt_mask = self.tt_size - 1
+        self.transposition_table = np.zeros(self.tt_size, dtype=TT_DTYPE)
+        
+        # Move ordering tables - both flat int arrays. Killers hold two
+        # 16-bit encoded moves per ply (from | to << 6 | promo << 12, 0 =
+        # empty) so killer tests are int compares, not Move.__eq__ calls;
+        # history is 64x64 indexed by (from << 6) | to
+        self.killer_moves = array.array('H', [0] * 128)
+        self.history_table = array.array('i', [0] * 4096)
+
+
+        # Incrementally maintained hash of the current search position
+        self.current_hash = 0
+        self._hash_stack: List[int] = []
+
+        # Static evaluation cache keyed by Zobrist hash
+        self._eval_cache: Dict[int, int] = {}
+
+        # Ordered-move cache keyed by (hash, ply), reused across PVS
+        # re-searches and iterative-deepening revisits of the same node
+        self._order_cache: Dict[Tuple[int, int], List[chess.Move]] = {}
+
+        # Root-splitting: >1 enables a process pool that searches sibling
+        # root moves in parallel after the first move establishes alpha
+        self.root_workers = 1
+        self._root_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+        # Delta-pruning bounds, denominated in the evaluator's own units.
+        # The defaults match the template's centipawn evaluation; subclasses
+        # whose _evaluate_position uses a different scale must override both
+        # or the quiescence prune cuts captures that would raise the score
+        self._delta_victim = VICTIM_SCORE
+        self._delta_margin = DELTA_MARGIN
+
+    def _castling_hash(self, board: chess.Board) -> int:
+        """Hash contribution of the current castling rights"""
         key = 0
-        
-        # Pieces
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                key ^= self.zobrist_pieces[(square, piece.piece_type, piece.color)]
-        
-        # Side to move
-        if board.turn == chess.BLACK:
-            key ^= self.zobrist_side_to_move
-            
-        # Castling rights
-        castling_key = 0
         if board.has_kingside_castling_rights(chess.WHITE):
-            castling_key ^= self.zobrist_castling[0]
+            key ^= ZOBRIST_CASTLING[0]
         if board.has_queenside_castling_rights(chess.WHITE):
-            castling_key ^= self.zobrist_castling[1]
+            key ^= ZOBRIST_CASTLING[1]
         if board.has_kingside_castling_rights(chess.BLACK):
-            castling_key ^= self.zobrist_castling[2]
+            key ^= ZOBRIST_CASTLING[2]
         if board.has_queenside_castling_rights(chess.BLACK):
-            castling_key ^= self.zobrist_castling[3]
-        key ^= castling_key
-        
-        # En passant
+            key ^= ZOBRIST_CASTLING[3]
+        return key
+
+    def _ep_hash(self, board: chess.Board) -> int:
+        """Hash contribution of the current en passant square"""
         if board.ep_square is not None:
-            key ^= self.zobrist_en_passant[chess.square_file(board.ep_square)]
-            
+            return ZOBRIST_EP[chess.square_file(board.ep_square)]
+        return 0
+
+    def _get_zobrist_key(self, board: chess.Board) -> int:
+        """Calculate Zobrist hash for current position (full rescan, used to seed)"""
+        key = 0
+
+        # Pieces - piece_map() yields only occupied squares, skipping the
+        # per-square None checks of a full 64-square scan
+        for square, piece in board.piece_map().items():
+            key ^= ZOBRIST_PIECES[(square) * 12 + ((piece.piece_type) - 1) * 2 + (piece.color)]
+
+        # Side to move
+        if board.turn == chess.BLACK:
+            key ^= ZOBRIST_SIDE_TO_MOVE
+
+        # Castling rights and en passant
+        key ^= self._castling_hash(board)
+        key ^= self._ep_hash(board)
+
         return key
-    
+
+    def _do_move(self, board: chess.Board, move: chess.Move):
+        """Push a move, incrementally updating self.current_hash"""
+        self._hash_stack.append(self.current_hash)
+        key = self.current_hash
+
+        # XOR out state that changes with every move
+        key ^= self._castling_hash(board)
+        key ^= self._ep_hash(board)
+        key ^= ZOBRIST_SIDE_TO_MOVE
+
+        if move:  # null moves only toggle side/ep/castling state
+            piece = board.piece_at(move.from_square)
+            color = piece.color
+
+            # Remove the moving piece from its origin square
+            key ^= ZOBRIST_PIECES[(move.from_square) * 12 + ((piece.piece_type) - 1) * 2 + (color)]
+
+            # Remove any captured piece (en passant captures off the to-square)
+            if board.is_en_passant(move):
+                cap_square = move.to_square + (-8 if color == chess.WHITE else 8)
+                key ^= ZOBRIST_PIECES[(cap_square) * 12 + ((chess.PAWN) - 1) * 2 + (not color)]
+            elif board.is_capture(move):
+                captured = board.piece_at(move.to_square)
+                key ^= ZOBRIST_PIECES[(move.to_square) * 12 + ((captured.piece_type) - 1) * 2 + (captured.color)]
+
+            # Place the (possibly promoted) piece on the target square
+            placed_type = move.promotion if move.promotion else piece.piece_type
+            key ^= ZOBRIST_PIECES[(move.to_square) * 12 + ((placed_type) - 1) * 2 + (color)]
+
+            # Castling also moves the rook
+            if board.is_castling(move):
+                if chess.square_file(move.to_square) > chess.square_file(move.from_square):
+                    rook_from = chess.square(7, chess.square_rank(move.from_square))
+                    rook_to = move.to_square - 1
+                else:
+                    rook_from = chess.square(0, chess.square_rank(move.from_square))
+                    rook_to = move.to_square + 1
+                key ^= ZOBRIST_PIECES[(rook_from) * 12 + ((chess.ROOK) - 1) * 2 + (color)]
+                key ^= ZOBRIST_PIECES[(rook_to) * 12 + ((chess.ROOK) - 1) * 2 + (color)]
+
+        board.push(move)
+
+        # XOR in the post-move castling/ep state
+        key ^= self._castling_hash(board)
+        key ^= self._ep_hash(board)
+
+        self.current_hash = key
+
+    def _undo_move(self, board: chess.Board):
+        """Pop a move pushed via _do_move, restoring self.current_hash"""
+        board.pop()
+        self.current_hash = self._hash_stack.pop()
+
+    def _seed_search_state(self, board: chess.Board):
+        """
+        Seed the incremental per-search state from a root position.
+
+        Every search entry point (get_best_move, root-split workers) calls
+        this before searching. Subclasses that maintain extra incremental
+        state alongside the Zobrist hash override it and call super(), so
+        new entry points can't miss a subclass's seeding.
+        """
+        self.current_hash = self._get_zobrist_key(board)
+        self._hash_stack.clear()
+        self._order_cache.clear()
+
     def _is_time_up(self) -> bool:
-        """Check if allocated time has been exceeded"""
+        """
+        Check if allocated time has been exceeded
+
+        The clock is only read every 4096 nodes; in between, the cached
+        answer is returned, removing a time.time() call per node.
+        """
         if self.time_limit <= 0:
             return False
-        return time.time() - self.start_time >= self.time_limit
+        if self.nodes_searched & 0xFFF:
+            return self._time_up_cached
+        self._time_up_cached = time.time() - self.start_time >= self.time_limit
+        return self._time_up_cached
     
     def _calculate_time_limit(self, time_left: float, increment: float = 0) -> float:
         """
@@ -293,6 +446,24 @@ class ChessEngineTemplate:
             # Non-material engines must override this method
             return 0
     
+    def _evaluate_cached(self, board: chess.Board) -> int:
+        """
+        Evaluate the position, reusing a cached result for transposed positions
+
+        Keyed by the incremental Zobrist hash, so identical positions reached
+        via different move orders skip the full evaluation sweep.
+        """
+        key = self.current_hash
+        cached = self._eval_cache.get(key)
+        if cached is not None:
+            return cached
+
+        value = self._evaluate_position(board)
+        if len(self._eval_cache) > 1_000_000:  # Bound memory on very long games
+            self._eval_cache.clear()
+        self._eval_cache[key] = value
+        return value
+
     def _evaluate_material_simple(self, board: chess.Board) -> int:
         """
         Simple material balance evaluation (baseline implementation)
@@ -304,18 +475,17 @@ class ChessEngineTemplate:
         """
         if not self.piece_values:
             return 0
-            
-        score = 0
-        
-        for piece_type in chess.PIECE_TYPES:
-            if piece_type == chess.KING:
-                continue
-                
-            white_count = len(board.pieces(piece_type, chess.WHITE))
-            black_count = len(board.pieces(piece_type, chess.BLACK))
-            piece_value = self.piece_values[piece_type]
-            score += (white_count - black_count) * piece_value
-        
+
+        # Hand the raw bitboards to the integer kernel; no SquareSet or
+        # Piece objects are built on the way
+        pv = self.piece_values
+        score = _material_score(
+            board.pawns, board.knights, board.bishops, board.rooks, board.queens,
+            board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK],
+            pv[chess.PAWN], pv[chess.KNIGHT], pv[chess.BISHOP],
+            pv[chess.ROOK], pv[chess.QUEEN],
+        )
+
         return score if board.turn == chess.WHITE else -score
     
     def _evaluate_material_with_bishop_pairs(self, board: chess.Board) -> int:
@@ -328,84 +498,93 @@ class ChessEngineTemplate:
         """
         if not self.piece_values:
             return 0
-            
-        score = 0
+
+        pv = self.piece_values
+        white = board.occupied_co[chess.WHITE]
+        black = board.occupied_co[chess.BLACK]
+
         bishop_pair_bonus = 50
         bishop_alone_penalty = 50
-        
-        white_bishops = len(board.pieces(chess.BISHOP, chess.WHITE))
-        black_bishops = len(board.pieces(chess.BISHOP, chess.BLACK))
-        
-        for piece_type in chess.PIECE_TYPES:
-            if piece_type == chess.KING:
-                continue
-                
-            white_count = len(board.pieces(piece_type, chess.WHITE))
-            black_count = len(board.pieces(piece_type, chess.BLACK))
-            
-            if piece_type == chess.BISHOP:
-                # Dynamic bishop evaluation
-                white_bishop_value = self.piece_values[chess.BISHOP]
-                black_bishop_value = self.piece_values[chess.BISHOP]
-                
-                if white_bishops == 2:
-                    white_bishop_value += bishop_pair_bonus // 2
-                elif white_bishops == 1:
-                    white_bishop_value -= bishop_alone_penalty
-                    
-                if black_bishops == 2:
-                    black_bishop_value += bishop_pair_bonus // 2
-                elif black_bishops == 1:
-                    black_bishop_value -= bishop_alone_penalty
-                    
-                score += white_count * white_bishop_value - black_count * black_bishop_value
-            else:
-                piece_value = self.piece_values[piece_type]
-                score += white_count * piece_value - black_count * piece_value
-        
+
+        # Bishops carry dynamic values, so handle them outside the kernel
+        white_bishops = (board.bishops & white).bit_count()
+        black_bishops = (board.bishops & black).bit_count()
+
+        white_bishop_value = pv[chess.BISHOP]
+        black_bishop_value = pv[chess.BISHOP]
+
+        if white_bishops == 2:
+            white_bishop_value += bishop_pair_bonus // 2
+        elif white_bishops == 1:
+            white_bishop_value -= bishop_alone_penalty
+
+        if black_bishops == 2:
+            black_bishop_value += bishop_pair_bonus // 2
+        elif black_bishops == 1:
+            black_bishop_value -= bishop_alone_penalty
+
+        score = _material_score(
+            board.pawns, board.knights, 0, board.rooks, board.queens,
+            white, black,
+            pv[chess.PAWN], pv[chess.KNIGHT], 0, pv[chess.ROOK], pv[chess.QUEEN],
+        )
+        score += white_bishops * white_bishop_value - black_bishops * black_bishop_value
+
         # Small bonus for piece count diversity (prefer pieces over pawns)
-        white_pieces = sum(len(board.pieces(pt, chess.WHITE)) for pt in chess.PIECE_TYPES if pt != chess.KING)
-        black_pieces = sum(len(board.pieces(pt, chess.BLACK)) for pt in chess.PIECE_TYPES if pt != chess.KING)
-        score += (white_pieces - black_pieces) * 5
-        
+        not_kings = ~board.kings
+        score += ((white & not_kings).bit_count() - (black & not_kings).bit_count()) * 5
+
         return score if board.turn == chess.WHITE else -score
     
-    def _quiescence_search(self, board: chess.Board, alpha: float, beta: float, depth: int = 0) -> float:
+    def _quiescence_search(self, board: chess.Board, alpha: int, beta: int, depth: int = 0,
+                           stand_pat: Optional[int] = None) -> int:
         """
         Quiescence search to avoid horizon effect on captures
-        
+
         Args:
             board: Current position
             alpha: Alpha value for pruning
             beta: Beta value for pruning
             depth: Current quiescence depth
-            
+            stand_pat: Static evaluation if the caller already computed it
+
         Returns:
             Evaluation score
         """
+        if stand_pat is None:
+            stand_pat = self._evaluate_cached(board)
+
         if self._is_time_up() or depth > MAX_QUIESCENCE_DEPTH:
-            return self._evaluate_position(board)
-            
+            return stand_pat
+
         self.nodes_searched += 1
-        stand_pat = self._evaluate_position(board)
         
         if stand_pat >= beta:
             return beta
         if stand_pat > alpha:
             alpha = stand_pat
             
-        # Generate and sort captures
-        captures = []
-        for move in board.legal_moves:
-            if board.is_capture(move):
-                captures.append((self._mvv_lva_score(board, move), move))
-        
+        # Generate and sort captures - generate_legal_captures yields only
+        # captures, so the quiet bulk of the move list is never produced.
+        # Victims are valued on the engine's delta scale (same ordering as
+        # MVV; en passant leaves the to-square empty -> pawn value)
+        delta_victim = self._delta_victim
+        captures = [(delta_victim[board.piece_type_at(move.to_square) or chess.PAWN], move)
+                    for move in board.generate_legal_captures()]
         captures.sort(key=lambda x: x[0], reverse=True)
-        
-        for _, move in captures:
-            board.push(move)
+
+        delta_margin = self._delta_margin
+        for victim_value, move in captures:
+            # Delta pruning: even winning this victim outright plus the
+            # margin cannot lift the score to alpha, so don't descend.
+            # Promotions are exempt - they gain more than the victim.
+            if (stand_pat + victim_value + delta_margin <= alpha
+                    and not move.promotion):
+                continue
+
+            self._do_move(board, move)
             score = -self._quiescence_search(board, -beta, -alpha, depth + 1)
-            board.pop()
+            self._undo_move(board)
             
             if score >= beta:
                 return beta
@@ -416,23 +595,14 @@ class ChessEngineTemplate:
     
     def _mvv_lva_score(self, board: chess.Board, move: chess.Move) -> int:
         """
-        Most Valuable Victim - Least Valuable Attacker scoring
-        
-        Uses approximate piece values for move ordering.
+        Most Valuable Victim capture scoring
+
+        Victim-only: the attacker term barely changes ordering quality but
+        costs a second piece_type_at per capture. piece_type_at avoids
+        allocating Piece objects (to-square is empty for en passant -> 0).
         """
-        if not board.is_capture(move):
-            return 0
-            
-        victim = board.piece_at(move.to_square)
-        attacker = board.piece_at(move.from_square)
-        
-        if victim is None or attacker is None:
-            return 0
-            
-        victim_value = self._get_approximate_piece_value(victim.piece_type)
-        attacker_value = self._get_approximate_piece_value(attacker.piece_type)
-        
-        return victim_value * 10 - attacker_value
+        victim = board.piece_type_at(move.to_square)
+        return VICTIM_SCORE[victim] if victim else 0
     
     def _order_moves(self, board: chess.Board, moves: List[chess.Move], ply: int, 
                      tt_move: Optional[chess.Move] = None) -> List[chess.Move]:
@@ -441,100 +611,167 @@ class ChessEngineTemplate:
         
         Priority:
         1. TT move (from transposition table)
-        2. Checkmate threats
-        3. Checks  
-        4. Captures (MVV-LVA)
-        5. Killer moves
-        6. Pawn advances/promotions
-        7. History heuristic
-        8. Other moves
+        2. Checks
+        3. Captures (MVV-LVA)
+        4. Killer moves
+        5. Pawn advances/promotions
+        6. History heuristic
+        7. Other moves
         """
         scored_moves = []
-        
+        if ply * 2 < len(self.killer_moves):
+            killer0 = self.killer_moves[ply * 2]
+            killer1 = self.killer_moves[ply * 2 + 1]
+        else:
+            killer0 = killer1 = 0
+        pawn_advance = PAWN_ADVANCE[board.turn]
+        own_pawns = board.pawns & board.occupied_co[board.turn]
+
         for move in moves:
             score = 0
             
             # TT move gets highest priority
             if tt_move and move == tt_move:
                 score = 1000000
-            # Checkmate threats
+            # Checks - the cheap attack test only; mate detection here cost a
+            # full make/unmake per checking move and search finds the mate one
+            # ply deeper anyway
             elif board.gives_check(move):
-                board.push(move)
-                if board.is_checkmate():
-                    score = CHECKMATE_BONUS
-                else:
-                    score = CHECK_BONUS  # Regular checks
-                board.pop()
-            # Captures
+                score = CHECK_BONUS
+            # Captures - victim lookup inlined (en passant target is empty
+            # -> None -> 0), saving a method call per capture
             elif board.is_capture(move):
-                score = CAPTURE_BONUS + self._mvv_lva_score(board, move)
-            # Killer moves
-            elif ply < len(self.killer_moves) and move in self.killer_moves[ply]:
+                victim = board.piece_type_at(move.to_square)
+                score = CAPTURE_BONUS + (VICTIM_SCORE[victim] if victim else 0)
+            # Killer moves - two int compares against the encoded slots
+            elif killer0 and (
+                    (encoded := move.from_square | (move.to_square << 6)
+                     | ((move.promotion or 0) << 12)) == killer0
+                    or encoded == killer1):
                 score = KILLER_BONUS
             # Pawn promotions
             elif move.promotion:
                 score = PROMOTION_BONUS + self._get_approximate_piece_value(move.promotion)
-            # Pawn advances (towards 7th/2nd rank)
+            # Pawn advances (towards 7th/2nd rank) - one branchless table
+            # lookup instead of per-move rank/color comparisons
             else:
-                piece = board.piece_at(move.from_square)
-                if piece and piece.piece_type == chess.PAWN:
-                    to_rank = chess.square_rank(move.to_square)
-                    if board.turn == chess.WHITE and to_rank >= 5:
-                        score = PAWN_ADVANCE_BONUS + to_rank * 1000
-                    elif board.turn == chess.BLACK and to_rank <= 2:
-                        score = PAWN_ADVANCE_BONUS + (7 - to_rank) * 1000
-                else:
+                from_square = move.from_square
+                # Bitboard test against the hoisted own-pawn mask instead of
+                # a piece_at call (which allocates a Piece) per quiet move
+                if (1 << from_square) & own_pawns:
+                    score = pawn_advance[move.to_square]
+                if not score:
                     # History heuristic for other moves
-                    key = (move.from_square, move.to_square)
-                    score = self.history_table.get(key, 0)
+                    score = self.history_table[(from_square << 6) | move.to_square]
                 
             scored_moves.append((score, move))
         
         scored_moves.sort(key=lambda x: x[0], reverse=True)
         return [move for _, move in scored_moves]
     
+    def _iter_search_moves(self, board: chess.Board, legal_moves: List[chess.Move],
+                           ply: int, tt_move: Optional[chess.Move],
+                           zobrist_key: int):
+        """
+        Yield moves in search order, deferring full ordering until needed
+
+        Stage 1 is the TT move on its own: when it produces an immediate
+        cutoff (the common case at TT hits) the remaining moves are never
+        scored or sorted. Only if search continues is _order_moves invoked
+        for the rest - it remains the subclass customization point for the
+        capture/killer/quiet staging itself.
+        """
+        # Forced moves (single recapture, only check evasion) need no
+        # scoring, sorting or cache entry at all
+        if len(legal_moves) == 1:
+            yield legal_moves[0]
+            return
+
+        yielded_tt = False
+        if tt_move is not None and tt_move in legal_moves:
+            yielded_tt = True
+            yield tt_move
+
+        order_key = (zobrist_key, ply)
+        ordered_moves = self._order_cache.get(order_key)
+        if ordered_moves is None:
+            ordered_moves = self._order_moves(board, legal_moves, ply, tt_move)
+            self._order_cache[order_key] = ordered_moves
+
+        for move in ordered_moves:
+            if yielded_tt and move == tt_move:
+                continue
+            yield move
+
     def _update_killer_moves(self, move: chess.Move, ply: int):
         """Update killer moves table"""
-        if ply < len(self.killer_moves):
-            if self.killer_moves[ply][0] != move:
-                self.killer_moves[ply][1] = self.killer_moves[ply][0]
-                self.killer_moves[ply][0] = move
+        i = ply * 2
+        if i < len(self.killer_moves):
+            encoded = self._encode_move(move)
+            if self.killer_moves[i] != encoded:
+                self.killer_moves[i + 1] = self.killer_moves[i]
+                self.killer_moves[i] = encoded
     
     def _update_history(self, move: chess.Move, depth: int):
         """Update history heuristic table"""
-        key = (move.from_square, move.to_square)
-        self.history_table[key] = self.history_table.get(key, 0) + depth * depth
+        self.history_table[(move.from_square << 6) | move.to_square] += depth * depth
     
-    def _store_tt_entry(self, zobrist_key: int, depth: int, value: float, 
+    @staticmethod
+    def _encode_move(move: chess.Move) -> int:
+        """Pack a move into 16 bits: from | to << 6 | promotion << 12"""
+        return move.from_square | (move.to_square << 6) | ((move.promotion or 0) << 12)
+
+    @staticmethod
+    def _decode_move(encoded: int) -> Optional[chess.Move]:
+        """Unpack a 16-bit encoded move (0 means no move)"""
+        if not encoded:
+            return None
+        promotion = (encoded >> 12) & 0x7
+        return chess.Move(encoded & 0x3F, (encoded >> 6) & 0x3F, promotion or None)
+
+    def _store_tt_entry(self, zobrist_key: int, depth: int, value: int,
                        node_type: NodeType, best_move: Optional[chess.Move]):
-        """Store entry in transposition table"""
-        if len(self.transposition_table) >= self.tt_size:
-            # Simple replacement: remove oldest entries
-            old_keys = [k for k, v in self.transposition_table.items() if v.age < self.age - 2]
-            for key in old_keys[:len(old_keys)//2]:  # Remove half of old entries
-                del self.transposition_table[key]
-        
-        self.transposition_table[zobrist_key] = TTEntry(
-            zobrist_key, depth, value, node_type, best_move, self.age
-        )
-    
-    def _probe_tt(self, zobrist_key: int, depth: int, alpha: float, beta: float) -> Tuple[Optional[float], Optional[chess.Move]]:
+        """Store entry in transposition table (depth/age-scored replacement)"""
+        entry = self.transposition_table[zobrist_key & self.tt_mask]
+
+        # Depth-preferred with an age discount: a deeper entry survives, but
+        # each search it has aged costs it two plies of protection, so old
+        # deep entries eventually yield the slot to current shallow ones
+        if entry['key']:
+            age_gap = (self.age - int(entry['age'])) & 0xFFFF
+            if depth + 2 * age_gap < int(entry['depth']):
+                return
+
+        entry['key'] = zobrist_key
+        entry['depth'] = depth
+        entry['value'] = value
+        entry['flag'] = node_type.value
+        entry['move'] = self._encode_move(best_move) if best_move else 0
+        entry['age'] = self.age & 0xFFFF
+
+    def _probe_tt(self, zobrist_key: int, depth: int, alpha: int, beta: int) -> Tuple[Optional[int], Optional[chess.Move]]:
         """Probe transposition table"""
-        entry = self.transposition_table.get(zobrist_key)
-        if entry is None or entry.depth < depth:
-            return None, entry.best_move if entry else None
-            
-        if entry.node_type == NodeType.EXACT:
-            return entry.value, entry.best_move
-        elif entry.node_type == NodeType.LOWER_BOUND and entry.value >= beta:
-            return entry.value, entry.best_move
-        elif entry.node_type == NodeType.UPPER_BOUND and entry.value <= alpha:
-            return entry.value, entry.best_move
-            
-        return None, entry.best_move
+        entry = self.transposition_table[zobrist_key & self.tt_mask]
+        if entry['key'] != zobrist_key:
+            return None, None
+
+        best_move = self._decode_move(int(entry['move']))
+        if entry['depth'] < depth:
+            return None, best_move
+
+        value = int(entry['value'])
+        flag = entry['flag']
+        if flag == NodeType.EXACT.value:
+            return value, best_move
+        elif flag == NodeType.LOWER_BOUND.value and value >= beta:
+            return value, best_move
+        elif flag == NodeType.UPPER_BOUND.value and value <= alpha:
+            return value, best_move
+
+        return None, best_move
     
-    def _search(self, board: chess.Board, depth: int, alpha: float, beta: float, 
-               ply: int, do_null_move: bool = True) -> Tuple[float, Optional[chess.Move]]:
+    def _search(self, board: chess.Board, depth: int, alpha: int, beta: int,
+               ply: int, do_null_move: bool = True) -> Tuple[int, Optional[chess.Move]]:
         """
         Main minimax search with alpha-beta pruning
         
@@ -550,8 +787,8 @@ class ChessEngineTemplate:
             Tuple of (evaluation, best_move)
         """
         if self._is_time_up():
-            return self._evaluate_position(board), None
-            
+            return self._evaluate_cached(board), None
+
         # Check for terminal nodes
         if board.is_game_over():
             if board.is_checkmate():
@@ -560,25 +797,31 @@ class ChessEngineTemplate:
                 return 0, None  # Draw
         
         if depth <= 0:
-            return self._quiescence_search(board, alpha, beta), None
-            
+            return self._quiescence_search(
+                board, alpha, beta, stand_pat=self._evaluate_cached(board)), None
+
         self.nodes_searched += 1
-        zobrist_key = self._get_zobrist_key(board)
+        zobrist_key = self.current_hash
         original_alpha = alpha
-        
+
         # Transposition table lookup
         tt_value, tt_move = self._probe_tt(zobrist_key, depth, alpha, beta)
         if tt_value is not None:
             return tt_value, tt_move
-        
-        # Null move pruning
-        if (do_null_move and depth >= 3 and not board.is_check() and 
-            self._evaluate_position(board) >= beta):
-            
-            board.push(chess.Move.null())
+
+        # Null move pruning - evaluate once here and reuse the result for the
+        # guard rather than re-deriving it inside the pruning condition
+        if do_null_move and depth >= 3 and not board.is_check():
+            static_eval = self._evaluate_cached(board)
+        else:
+            static_eval = None
+
+        if static_eval is not None and static_eval >= beta:
+
+            self._do_move(board, chess.Move.null())
             null_score, _ = self._search(board, depth - 3, -beta, -beta + 1, ply + 1, False)
             null_score = -null_score
-            board.pop()
+            self._undo_move(board)
             
             if null_score >= beta:
                 return beta, None
@@ -586,30 +829,41 @@ class ChessEngineTemplate:
         # Generate and order moves
         legal_moves = list(board.legal_moves)
         if not legal_moves:
-            return self._evaluate_position(board), None
-            
-        ordered_moves = self._order_moves(board, legal_moves, ply, tt_move)
+            return self._evaluate_cached(board), None
+
         best_move = None
-        best_value = -float('inf')
-        
-        for i, move in enumerate(ordered_moves):
-            board.push(move)
-            
+        best_value = -INF
+
+        for i, move in enumerate(self._iter_search_moves(board, legal_moves, ply,
+                                                         tt_move, zobrist_key)):
+            is_quiet = not board.is_capture(move)
+            self._do_move(board, move)
+
             # Use principal variation search for moves after the first
             if i == 0:
                 value, _ = self._search(board, depth - 1, -beta, -alpha, ply + 1)
                 value = -value
             else:
-                # Search with null window
-                value, _ = self._search(board, depth - 1, -alpha - 1, -alpha, ply + 1)
-                value = -value
-                
-                # Re-search if necessary
-                if alpha < value < beta:
-                    value, _ = self._search(board, depth - 1, -beta, -alpha, ply + 1)
+                # Late move reductions: late quiet non-checking moves are
+                # searched a ply shallower first and only re-searched at
+                # full depth if they unexpectedly beat alpha
+                if i >= 3 and depth >= 3 and is_quiet and not board.is_check():
+                    value, _ = self._search(board, depth - 2, -alpha - 1, -alpha, ply + 1)
                     value = -value
-            
-            board.pop()
+                else:
+                    value = alpha + 1  # no reduction - go straight to the null window
+
+                if value > alpha:
+                    # Search with null window
+                    value, _ = self._search(board, depth - 1, -alpha - 1, -alpha, ply + 1)
+                    value = -value
+
+                    # Re-search if necessary
+                    if alpha < value < beta:
+                        value, _ = self._search(board, depth - 1, -beta, -alpha, ply + 1)
+                        value = -value
+
+            self._undo_move(board)
             
             if value > best_value:
                 best_value = value
@@ -619,12 +873,18 @@ class ChessEngineTemplate:
                 alpha = value
                 
             if alpha >= beta:
-                # Beta cutoff - update tables
-                if not board.is_capture(move):
+                # Beta cutoff - update tables (capture flag was classified
+                # before the move was made, no re-check against the board)
+                if is_quiet:
                     self._update_killer_moves(move, ply)
                     self._update_history(move, depth)
                 break
         
+        # An interrupted search returns partial values - never let them into
+        # the table where the next ID iteration would trust them
+        if self._time_up_cached:
+            return best_value, best_move
+
         # Store in transposition table
         if best_value <= original_alpha:
             node_type = NodeType.UPPER_BOUND
@@ -637,6 +897,57 @@ class ChessEngineTemplate:
         
         return best_value, best_move
     
+    def _search_root(self, board: chess.Board, depth: int, alpha: int,
+                     beta: int) -> Tuple[int, Optional[chess.Move]]:
+        """
+        Search the root position, optionally splitting across processes.
+
+        With root_workers <= 1 (the default) this is exactly _search. Otherwise
+        the best-ordered move is searched serially to establish alpha (young
+        brothers wait), then the remaining root moves are farmed out to worker
+        processes with that window. Workers rebuild their own engine state, so
+        the split only pays off at depths where the subtree dominates setup cost.
+        """
+        if self.root_workers <= 1 or depth < 4:
+            return self._search(board, depth, alpha, beta, 0)
+
+        legal_moves = list(board.legal_moves)
+        if len(legal_moves) <= 1:
+            return self._search(board, depth, alpha, beta, 0)
+
+        ordered = self._order_moves(board, legal_moves, 0, None)
+
+        first = ordered[0]
+        self._do_move(board, first)
+        value, _ = self._search(board, depth - 1, -beta, -alpha, 1)
+        value = -value
+        self._undo_move(board)
+
+        best_value, best_move = value, first
+        if value > alpha:
+            alpha = value
+        if alpha >= beta or self._is_time_up():
+            return best_value, best_move
+
+        if self._root_pool is None:
+            self._root_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.root_workers - 1)
+
+        time_budget = max(self.time_limit - (time.time() - self.start_time), 0.05)
+        fen = board.fen()
+        futures = {
+            self._root_pool.submit(_search_root_move, type(self), fen,
+                                   move.uci(), depth, alpha, beta, time_budget): move
+            for move in ordered[1:]
+        }
+        for future in concurrent.futures.as_completed(futures):
+            _, value, nodes = future.result()
+            self.nodes_searched += nodes
+            if value > best_value:
+                best_value, best_move = value, futures[future]
+
+        return best_value, best_move
+
     def get_best_move(self, time_left: float = 0, increment: float = 0) -> Optional[chess.Move]:
         """
         Find the best move using iterative deepening
@@ -654,37 +965,66 @@ class ChessEngineTemplate:
         self.start_time = time.time()
         self.time_limit = self._calculate_time_limit(time_left, increment)
         self.nodes_searched = 0
+        self._time_up_cached = False
         self.age += 1
-        
+
+        # Seed the per-search incremental state from the root position
+        self._seed_search_state(self.board)
+
         best_move = None
-        best_value = -float('inf')
-        
+        best_value = -INF
+
+        # Buffer info lines so each iteration costs a single write and
+        # flushes are rate-limited instead of hitting stdout per depth
+        info_buf: List[str] = []
+        last_flush = self.start_time
+
         # Iterative deepening
         for depth in range(1, self.max_depth + 1):
             if self._is_time_up():
                 break
                 
             search_start = time.time()
-            value, move = self._search(self.board, depth, -float('inf'), float('inf'), 0)
+            if depth == 1 or best_move is None:
+                value, move = self._search_root(self.board, depth, -INF, INF)
+            else:
+                # Aspiration window around the previous iteration's score;
+                # on a fail only the violated bound is reopened, keeping the
+                # still-valid bound tight for the re-search
+                alpha = best_value - 50
+                beta = best_value + 50
+                while True:
+                    value, move = self._search_root(self.board, depth, alpha, beta)
+                    if alpha < value < beta or self._is_time_up():
+                        break
+                    if value <= alpha:
+                        alpha = -INF
+                    else:
+                        beta = INF
             search_time = time.time() - search_start
             
             if move is not None:
                 best_move = move
                 best_value = value
                 
-                # Output search info with flush for UCI output persistence
                 nps = int(self.nodes_searched / max(search_time, 0.001))
-                print(f"info depth {depth} score cp {value} nodes {self.nodes_searched} "
-                      f"nps {nps} time {int(search_time * 1000)} pv {move.uci()}")
-                sys.stdout.flush()  # Ensure output is visible immediately
-                
+                info_buf.append(f"info depth {depth} score cp {value} nodes {self.nodes_searched} "
+                                f"nps {nps} time {int(search_time * 1000)} pv {move.uci()}\n")
+                now = time.time()
+                if now - last_flush >= 0.05:
+                    sys.stdout.write(''.join(info_buf))
+                    sys.stdout.flush()
+                    info_buf.clear()
+                    last_flush = now
+
             if self._is_time_up():
                 break
-        
+
         total_time = time.time() - self.start_time
-        print(f"info string Search completed in {total_time:.3f}s, {self.nodes_searched} nodes")
-        sys.stdout.flush()  # Ensure final message is visible
-        
+        info_buf.append(f"info string Search completed in {total_time:.3f}s, {self.nodes_searched} nodes\n")
+        sys.stdout.write(''.join(info_buf))
+        sys.stdout.flush()
+
         return best_move
 
 
@@ -710,7 +1050,11 @@ class UCIEngineInterface:
         if engine_class is None:
             engine_class = ChessEngineTemplate
         self.engine = engine_class(**engine_kwargs)
-        
+
+        # Last applied position command as (base, move list) - GUIs resend
+        # the full game each move, so extensions only push the new suffix
+        self._last_position = None
+
     def run(self):
         """Main UCI loop"""
         while True:
@@ -742,7 +1086,8 @@ class UCIEngineInterface:
                         kwargs['piece_values'] = self.engine.piece_values.copy()
                     
                     self.engine = engine_class(**kwargs)
-                    
+                    self._last_position = None
+
                 elif line.startswith("setoption"):
                     self._handle_setoption(line)
                     
@@ -782,26 +1127,47 @@ class UCIEngineInterface:
                     kwargs['piece_values'] = self.engine.piece_values.copy()
                     
                 self.engine = engine_class(**kwargs)
-    
+                self._last_position = None
+
     def _handle_position(self, line: str):
         """Handle UCI position command"""
         parts = line.split()
         if parts[1] == "startpos":
-            self.engine.board = chess.Board()
-            moves_idx = 3 if len(parts) > 3 and parts[2] == "moves" else None
+            base = "startpos"
+            move_strs = parts[3:] if len(parts) > 3 and parts[2] == "moves" else []
         else:  # position fen ...
             fen_parts = []
             i = 2
             while i < len(parts) and parts[i] != "moves":
                 fen_parts.append(parts[i])
                 i += 1
-            self.engine.board = chess.Board(" ".join(fen_parts))
-            moves_idx = i + 1 if i < len(parts) - 1 and parts[i] == "moves" else None
-        
-        if moves_idx:
-            for move_str in parts[moves_idx:]:
+            base = " ".join(fen_parts)
+            move_strs = parts[i + 1:] if i < len(parts) - 1 and parts[i] == "moves" else []
+
+        # GUIs resend the whole game each move - when the new command just
+        # extends the previous one, push only the new suffix instead of
+        # rebuilding the board and replaying every move from scratch
+        last = self._last_position
+        if (last is not None and last[0] == base
+                and len(move_strs) >= len(last[1])
+                and move_strs[:len(last[1])] == last[1]):
+            new_moves = move_strs[len(last[1]):]
+        else:
+            self.engine.board = chess.Board() if base == "startpos" else chess.Board(base)
+            new_moves = move_strs
+
+        try:
+            for move_str in new_moves:
                 move = chess.Move.from_uci(move_str)
                 self.engine.board.push(move)
+        except Exception:
+            # A half-applied command leaves the board out of sync with the
+            # GUI - drop the cache so the next position command rebuilds
+            # from its base instead of extending a desynced board
+            self._last_position = None
+            raise
+
+        self._last_position = (base, move_strs)
     
     def _handle_go(self, line: str):
         """Handle UCI go command"""
@@ -878,34 +1244,84 @@ class CaptureOpponent(ChessEngineTemplate):
         super().__init__(**kwargs)
         
         assert self.piece_values is not None, "Capture Opponent requires piece_values"
-        
+
+        # piece_values flattened to a tuple indexed by piece type (1..6) -
+        # C-level tuple indexing instead of a dict hash in the hot methods
+        self._pv = (0,) + tuple(self.piece_values.get(pt, 0)
+                                for pt in chess.PIECE_TYPES)
+
+        # Delta-pruning bounds rescaled to this evaluation: a captured
+        # piece moves the score by pv * MATERIAL_REDUCTION_MULTIPLIER, and
+        # the margin must also absorb the capture-availability swing
+        # (NO_CAPTURE_PENALTY to CAPTURE_AVAILABLE_BONUS plus a few
+        # per-capture bonuses) - the template's centipawn bounds pruned
+        # captures worth tens of thousands here
+        self._delta_victim = tuple(v * MATERIAL_REDUCTION_MULTIPLIER
+                                   for v in self._pv)
+        self._delta_margin = (CAPTURE_AVAILABLE_BONUS + NO_CAPTURE_PENALTY
+                              + 5 * 10000)
+
         # Track starting material to measure reduction
         self.starting_material = self._calculate_total_material(chess.Board())
-    
+
+        # Running total-material count, updated on push/pop like the Zobrist
+        # hash so evaluation reads a cached int instead of sweeping the board
+        self._total_material = self._calculate_total_material(self.board)
+        self._material_stack: List[int] = []
+
+    def _do_move(self, board: chess.Board, move: chess.Move):
+        """Push a move, also updating the running total-material count"""
+        delta = 0
+        if move:
+            pv = self._pv
+            if board.is_en_passant(move):
+                delta -= pv[chess.PAWN]
+            else:
+                captured = board.piece_type_at(move.to_square)
+                if captured:
+                    delta -= pv[captured]
+            if move.promotion:
+                delta += pv[move.promotion] - pv[chess.PAWN]
+        super()._do_move(board, move)
+        self._total_material += delta
+        self._material_stack.append(delta)
+
+    def _undo_move(self, board: chess.Board):
+        """Pop a move pushed via _do_move, restoring the material count"""
+        super()._undo_move(board)
+        self._total_material -= self._material_stack.pop()
+
+    def _seed_search_state(self, board: chess.Board):
+        """Also reseed the running material count from the root position"""
+        super()._seed_search_state(board)
+        self._total_material = self._calculate_total_material(board)
+        self._material_stack.clear()
+
     def _calculate_total_material(self, board: chess.Board) -> int:
         """Calculate total material on the board (both sides combined)"""
         assert self.piece_values is not None
-        total = 0
-        for piece_type in [chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN]:
-            white_count = len(board.pieces(piece_type, chess.WHITE))
-            black_count = len(board.pieces(piece_type, chess.BLACK))
-            total += (white_count + black_count) * self.piece_values[piece_type]
-        return total
+        pv = self._pv
+        # Popcount the raw piece bitboards - both colors are summed anyway,
+        # so no SquareSet construction or per-color split is needed
+        return (board.pawns.bit_count() * pv[chess.PAWN]
+                + board.knights.bit_count() * pv[chess.KNIGHT]
+                + board.bishops.bit_count() * pv[chess.BISHOP]
+                + board.rooks.bit_count() * pv[chess.ROOK]
+                + board.queens.bit_count() * pv[chess.QUEEN])
     
     def _calculate_material_balance(self, board: chess.Board) -> int:
         """Calculate material balance (our advantage)"""
         assert self.piece_values is not None
-        our_material = 0
-        their_material = 0
-        
-        for piece_type in [chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN]:
-            our_count = len(board.pieces(piece_type, board.turn))
-            their_count = len(board.pieces(piece_type, not board.turn))
-            piece_value = self.piece_values[piece_type]
-            our_material += our_count * piece_value
-            their_material += their_count * piece_value
-        
-        return our_material - their_material
+        pv = self._pv
+        # Hoist the color masks once and popcount (pieces & us) - (pieces &
+        # them) per type - no SquareSets, no lookups inside a loop
+        us = board.occupied_co[board.turn]
+        them = board.occupied_co[not board.turn]
+        return (((board.pawns & us).bit_count() - (board.pawns & them).bit_count()) * pv[chess.PAWN]
+                + ((board.knights & us).bit_count() - (board.knights & them).bit_count()) * pv[chess.KNIGHT]
+                + ((board.bishops & us).bit_count() - (board.bishops & them).bit_count()) * pv[chess.BISHOP]
+                + ((board.rooks & us).bit_count() - (board.rooks & them).bit_count()) * pv[chess.ROOK]
+                + ((board.queens & us).bit_count() - (board.queens & them).bit_count()) * pv[chess.QUEEN])
     
     # No complex trade evaluation needed - ALL captures are good captures!
     
@@ -916,31 +1332,36 @@ class CaptureOpponent(ChessEngineTemplate):
         The key insight: We return a score from OUR perspective (side to move).
         Higher score = better for us. So we want HIGH scores when material is LOW.
         """
-        # Check for checkmate - we WIN or LOSE
-        if board.is_checkmate():
-            return -CHECKMATE_BONUS  # We're checkmated - BAD
-        
-        # Stalemate or insufficient material = SUCCESS! (we cleared the board)
-        if board.is_stalemate() or board.is_insufficient_material():
+        # One short-circuiting legality pass covers both checkmate (BAD -
+        # we're mated) and stalemate (SUCCESS - board cleared), instead of
+        # is_checkmate plus is_stalemate each scanning legal moves
+        if not any(board.generate_legal_moves()):
+            return -CHECKMATE_BONUS if board.is_check() else CHECKMATE_BONUS // 2
+
+        # Insufficient material = SUCCESS! (we cleared the board)
+        if board.is_insufficient_material():
             return CHECKMATE_BONUS // 2
         
-        # Calculate TOTAL material on board (both sides combined)
-        total_material = self._calculate_total_material(board)
-        
+        # TOTAL material on board (both sides combined) - read from the
+        # incrementally maintained count, no per-eval board sweep
+        total_material = self._total_material
+
         # PRIMARY GOAL: LOWER total material = HIGHER score
         # Starting material ~78, we want to get to 0
         # So score = (starting - current) * multiplier
         material_reduction = self.starting_material - total_material
         score = material_reduction * MATERIAL_REDUCTION_MULTIPLIER
         
-        # SECONDARY GOAL: Have captures available RIGHT NOW
-        capture_moves = [m for m in board.legal_moves if board.is_capture(m)]
-        
-        if len(capture_moves) > 0:
+        # SECONDARY GOAL: Have captures available RIGHT NOW - count straight
+        # off the capture generator, never materializing the full legal-move
+        # list or calling is_capture per move
+        num_captures = sum(1 for _ in board.generate_legal_captures())
+
+        if num_captures > 0:
             # HUGE reward for having captures
             score += CAPTURE_AVAILABLE_BONUS
             # Each additional capture is valuable
-            score += len(capture_moves) * 10000
+            score += num_captures * 10000
         else:
             # MASSIVE penalty if we can't capture anything
             score -= NO_CAPTURE_PENALTY
@@ -958,13 +1379,12 @@ class CaptureOpponent(ChessEngineTemplate):
         
         for move in moves:
             if board.is_capture(move):
-                # Score captures by victim value (higher value victims first)
-                victim = board.piece_at(move.to_square)
-                if victim:
-                    victim_value = self._get_approximate_piece_value(victim.piece_type)
-                else:
-                    victim_value = 1  # En passant
-                captures.append((victim_value, move))
+                # Score captures by victim value (higher value victims first);
+                # piece_type_at skips the Piece allocation of piece_at and the
+                # shared VICTIM_SCORE table skips a method call per capture
+                # (en passant leaves the to-square empty -> pawn value)
+                victim = board.piece_type_at(move.to_square)
+                captures.append((VICTIM_SCORE[victim or chess.PAWN], move))
             else:
                 non_captures.append(move)
         
@@ -979,7 +1399,9 @@ class CaptureOpponent(ChessEngineTemplate):
         # Update starting material if this is a new game
         if self.board.fullmove_number == 1 and self.board.turn == chess.WHITE:
             self.starting_material = self._calculate_total_material(self.board)
-        
+
+        # The running material count is reseeded via _seed_search_state,
+        # which the base get_best_move (and root-split workers) call
         return super().get_best_move(time_left, increment)
 
 
@@ -13,16 +13,42 @@ import chess.polyglot
 import random
 import json
 import os
+import functools
 from typing import Optional, Dict, Any
 from enum import Enum
 
+@functools.lru_cache(maxsize=None)
+def _load_json_book(path: str) -> dict:
+    """
+    Load and cache a JSON opening book by path.
+
+    Engines only ever read the book, so every OpponentEngine created in
+    this process shares one parsed dict instead of re-running json.load
+    (tens of MB for the comprehensive book) per construction.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
 class OpponentType(Enum):
     OPENING_ONLY_RANDOM = "opening_only_random"
-    RANDOM_ONLY = "random_only"  
+    RANDOM_ONLY = "random_only"
     ELO_400 = "elo_400"
     OPENING_PLUS_ELO_800 = "opening_plus_elo_800"
     OPENING_PLUS_ELO_1200 = "opening_plus_elo_1200"
 
+# Capability sets - frozensets built once instead of list literals
+# reconstructed on every _uses_* call
+_BOOK_TYPES = frozenset({
+    OpponentType.OPENING_ONLY_RANDOM,
+    OpponentType.OPENING_PLUS_ELO_800,
+    OpponentType.OPENING_PLUS_ELO_1200,
+})
+_STOCKFISH_TYPES = frozenset({
+    OpponentType.ELO_400,
+    OpponentType.OPENING_PLUS_ELO_800,
+    OpponentType.OPENING_PLUS_ELO_1200,
+})
+
 class OpponentEngine:
     def __init__(self, opponent_type: OpponentType, stockfish_path: Optional[str] = None):
         """
@@ -35,6 +61,7 @@ class OpponentEngine:
         self.opponent_type = opponent_type
         self.board = chess.Board()
         self.opening_book = None
+        self._book_cache = None  # (fen, move) of the last book probe
         self.stockfish_engine = None
         self.stockfish_path = stockfish_path
         
@@ -48,40 +75,34 @@ class OpponentEngine:
     
     def _uses_opening_book(self) -> bool:
         """Check if this opponent type uses opening book"""
-        return self.opponent_type in [
-            OpponentType.OPENING_ONLY_RANDOM,
-            OpponentType.OPENING_PLUS_ELO_800,
-            OpponentType.OPENING_PLUS_ELO_1200
-        ]
-    
+        return self.opponent_type in _BOOK_TYPES
+
     def _uses_stockfish(self) -> bool:
         """Check if this opponent type uses Stockfish"""
-        return self.opponent_type in [
-            OpponentType.ELO_400,
-            OpponentType.OPENING_PLUS_ELO_800,
-            OpponentType.OPENING_PLUS_ELO_1200
-        ]
+        return self.opponent_type in _STOCKFISH_TYPES
     
     def _load_opening_book(self):
         """Load opening book from polyglot file or JSON"""
-        # Try to load comprehensive opening book first
-        comprehensive_path = os.path.join(os.path.dirname(__file__), "..", "opening_books", "comprehensive_openings.json")
-        if os.path.exists(comprehensive_path):
-            with open(comprehensive_path, 'r') as f:
-                self.opening_book = json.load(f)
-                print(f"Loaded comprehensive opening book with {len(self.opening_book)} positions")
+        book_dir = os.path.join(os.path.dirname(__file__), "..", "opening_books")
+
+        # Prefer the binary Polyglot books: open_reader mmaps the file and
+        # binary-searches 16-byte records by Zobrist hash, so lookups cost
+        # O(log n) integer compares with no up-front json.load of tens of
+        # thousands of position dicts into resident memory
+        for bin_name in ("comprehensive_openings.bin", "book.bin"):
+            bin_path = os.path.join(book_dir, bin_name)
+            if os.path.exists(bin_path):
+                self.opening_book = chess.polyglot.open_reader(bin_path)
+                print(f"Loaded polyglot opening book: {bin_name}")
                 return
-        
-        # Try to load polyglot book
-        polyglot_path = os.path.join(os.path.dirname(__file__), "..", "opening_books", "book.bin")
-        if os.path.exists(polyglot_path):
-            self.opening_book = chess.polyglot.open_reader(polyglot_path)
-        else:
-            # Fallback to basic JSON-based opening book
-            json_path = os.path.join(os.path.dirname(__file__), "..", "opening_books", "openings.json")
+
+        # Fall back to the JSON books (parsed once per process, shared)
+        for json_name in ("comprehensive_openings.json", "openings.json"):
+            json_path = os.path.join(book_dir, json_name)
             if os.path.exists(json_path):
-                with open(json_path, 'r') as f:
-                    self.opening_book = json.load(f)
+                self.opening_book = _load_json_book(json_path)
+                print(f"Loaded opening book with {len(self.opening_book)} positions")
+                return
     
     def _init_stockfish(self):
         """Initialize Stockfish engine"""
@@ -102,9 +123,25 @@ class OpponentEngine:
                         break
                     except:
                         continue
+
+            # Configure strength once - the limit never changes for the
+            # lifetime of an opponent, and re-sending UCI options per move
+            # forces an option handshake before every search
+            elo_limit = self.get_elo_limit()
+            if self.stockfish_engine and elo_limit:
+                self.stockfish_engine.configure(
+                    {"UCI_LimitStrength": True, "UCI_Elo": elo_limit})
         except Exception as e:
             print(f"Warning: Could not initialize Stockfish: {e}")
             print("Falling back to random moves for non-opening positions")
+            # A failed strength limit must not leave a full-strength engine
+            # behind - drop it so play really falls back to random moves
+            if self.stockfish_engine:
+                try:
+                    self.stockfish_engine.quit()
+                except Exception:
+                    pass
+                self.stockfish_engine = None
     
     def get_elo_limit(self) -> Optional[int]:
         """Get the ELO limit for this opponent type"""
@@ -125,8 +162,6 @@ class OpponentEngine:
         Returns:
             Chess move or None if no move available
         """
-        self.board = board.copy()
-        
         # Check for game end
         if board.is_game_over():
             return None
@@ -148,16 +183,35 @@ class OpponentEngine:
         """Get move from opening book"""
         if not self.opening_book:
             return None
-            
+
+        # One-entry cache: get_move probes the book and callers often probe
+        # again for the same position right after (e.g. test harness asking
+        # where the move came from). Also keeps the random pick stable for
+        # repeated probes of the same position.
+        fen = board.fen()
+        cached = self._book_cache
+        if cached is not None and cached[0] == fen:
+            return cached[1]
+
+        move = self._probe_opening_book(board)
+        self._book_cache = (fen, move)
+        return move
+
+    def _probe_opening_book(self, board: chess.Board) -> Optional[chess.Move]:
+        """Look up the current position in the loaded book"""
         try:
             if isinstance(self.opening_book, dict):
-                # JSON-based opening book
-                fen = board.fen().split(' ')[0]  # Just the position part
-                if fen in self.opening_book:
-                    moves = self.opening_book[fen]
-                    if moves:
-                        move_str = random.choice(moves)
-                        return chess.Move.from_uci(move_str)
+                # JSON-based opening book - EPD keys first (side to move,
+                # castling and en passant included), falling back to the
+                # placement-only keys of older books
+                moves = self.opening_book.get(board.epd())
+                if moves is None:
+                    # board_fen() renders just the placement field - no
+                    # side/castling/ep/counter formatting thrown away
+                    moves = self.opening_book.get(board.board_fen())
+                if moves:
+                    move_str = random.choice(moves)
+                    return chess.Move.from_uci(move_str)
             else:
                 # Polyglot opening book
                 try:
@@ -182,12 +236,8 @@ class OpponentEngine:
             return None
             
         try:
-            # Configure Stockfish ELO if specified
-            elo_limit = self.get_elo_limit()
-            if elo_limit:
-                self.stockfish_engine.configure({"UCI_LimitStrength": True, "UCI_Elo": elo_limit})
-            
-            # Get move with time limit
+            # Get move with time limit (strength is configured once in
+            # _init_stockfish)
             result = self.stockfish_engine.play(board, chess.engine.Limit(time=1.0))
             return result.move
         except Exception as e:
@@ -208,22 +258,25 @@ class OpponentEngine:
         if self.opening_book and hasattr(self.opening_book, 'close'):
             self.opening_book.close()
 
-def create_opponent(opponent_type: str, stockfish_path: Optional[str] = None) -> OpponentEngine:
+def create_opponent(opponent_type, stockfish_path: Optional[str] = None) -> OpponentEngine:
     """
     Factory function to create opponent engines
-    
+
     Args:
-        opponent_type: String representation of opponent type
+        opponent_type: OpponentType member, or its string value (callers
+                       holding the enum skip the string-to-member lookup)
         stockfish_path: Optional path to Stockfish binary
-        
+
     Returns:
         OpponentEngine instance
     """
+    if isinstance(opponent_type, OpponentType):
+        return OpponentEngine(opponent_type, stockfish_path)
     try:
         opp_type = OpponentType(opponent_type)
-        return OpponentEngine(opp_type, stockfish_path)
     except ValueError:
         raise ValueError(f"Unknown opponent type: {opponent_type}")
+    return OpponentEngine(opp_type, stockfish_path)
 
 if __name__ == "__main__":
     # Example usage
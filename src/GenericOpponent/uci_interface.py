@@ -13,6 +13,17 @@ import chess
 import threading
 import time
 
+# Memoized UCI move parsing - GUIs resend the full move history with every
+# position command, so the same strings get parsed over and over
+_MOVE_CACHE = {}
+
+def _move_from_uci(move_str):
+    move = _MOVE_CACHE.get(move_str)
+    if move is None:
+        move = chess.Move.from_uci(move_str)
+        _MOVE_CACHE[move_str] = move
+    return move
+
 class UCIOpponentEngine:
     def __init__(self, opponent_type: OpponentType):
         self.opponent_type = opponent_type
@@ -20,7 +31,10 @@ class UCIOpponentEngine:
         self.board = chess.Board()
         self.searching = False
         self.search_thread = None
-        
+        # Last applied position command as (base, move list) - GUIs resend
+        # the full game each move, so extensions only push the new suffix
+        self._last_position = None
+
     def send(self, message):
         """Send message to GUI"""
         print(message, flush=True)
@@ -50,17 +64,18 @@ class UCIOpponentEngine:
             
     def handle_ucinewgame(self):
         """Handle ucinewgame command"""
-        self.board = chess.Board()
-        
+        self.board.reset()
+        self._last_position = None
+
     def handle_position(self, command):
         """Handle position command"""
         parts = command.split()
         if len(parts) < 2:
             return
-            
+
         if parts[1] == "startpos":
-            self.board = chess.Board()
-            moves_start = 2
+            base = "startpos"
+            move_strs = parts[3:] if len(parts) > 3 and parts[2] == "moves" else []
         elif parts[1] == "fen":
             # Find where moves start
             moves_start = None
@@ -68,34 +83,56 @@ class UCIOpponentEngine:
                 if part == "moves":
                     moves_start = i + 1
                     break
-            
+
             if moves_start:
-                fen = " ".join(parts[2:moves_start-1])
+                base = " ".join(parts[2:moves_start-1])
+                move_strs = parts[moves_start:]
             else:
-                fen = " ".join(parts[2:])
-                moves_start = len(parts)
-                
-            try:
-                self.board = chess.Board(fen)
-            except:
-                self.send("info string Invalid FEN")
-                return
+                base = " ".join(parts[2:])
+                move_strs = []
         else:
             return
-            
-        # Apply moves
-        if moves_start < len(parts) and parts[moves_start-1] == "moves":
-            for move_str in parts[moves_start:]:
+
+        # GUIs resend the whole game each move - when the new command just
+        # extends the previous one, push only the new suffix instead of
+        # rebuilding the board and replaying every move from scratch
+        last = self._last_position
+        if (last is not None and last[0] == base
+                and len(move_strs) >= len(last[1])
+                and move_strs[:len(last[1])] == last[1]):
+            new_moves = move_strs[len(last[1]):]
+        else:
+            # Reuse the existing board - reset/set_fen rewrite its state
+            # in place instead of allocating a fresh Board per message
+            if base == "startpos":
+                self.board.reset()
+            else:
                 try:
-                    move = chess.Move.from_uci(move_str)
-                    if move in self.board.legal_moves:
-                        self.board.push(move)
-                    else:
-                        self.send(f"info string Illegal move: {move_str}")
-                        return
-                except:
-                    self.send(f"info string Invalid move format: {move_str}")
+                    self.board.set_fen(base)
+                except ValueError:
+                    self.send("info string Invalid FEN")
+                    self._last_position = None
                     return
+            new_moves = move_strs
+
+        # Apply moves - is_legal is a targeted test against the move's own
+        # squares, unlike `move in self.board.legal_moves` which regenerated
+        # every legal move per history move
+        for move_str in new_moves:
+            try:
+                move = _move_from_uci(move_str)
+            except ValueError:
+                self.send(f"info string Invalid move format: {move_str}")
+                self._last_position = None
+                return
+            if self.board.is_legal(move):
+                self.board.push(move)
+            else:
+                self.send(f"info string Illegal move: {move_str}")
+                self._last_position = None
+                return
+
+        self._last_position = (base, move_strs)
                     
     def search_worker(self):
         """Worker thread for searching"""
@@ -140,14 +177,17 @@ class UCIOpponentEngine:
         
     def run(self):
         """Main UCI loop"""
-        while True:
+        # Iterate stdin's readline directly instead of calling input() per
+        # line - no prompt handling or per-call stdout flush, and the loop
+        # ends cleanly on EOF when readline returns ''
+        for line in iter(sys.stdin.readline, ''):
             try:
-                line = input().strip()
+                line = line.strip()
                 if not line:
                     continue
-                    
+
                 command = line.split()[0]
-                
+
                 if command == "uci":
                     self.handle_uci()
                 elif command == "isready":
@@ -165,9 +205,7 @@ class UCIOpponentEngine:
                 else:
                     # Unknown command, ignore
                     pass
-                    
-            except EOFError:
-                break
+
             except Exception as e:
                 self.send(f"info string Error: {e}")
 
@@ -8,10 +8,24 @@ import sys
 import chess
 import random
 
+# Memoized UCI move parsing - GUIs resend the full move history with every
+# position command, so the same strings get parsed over and over
+_MOVE_CACHE = {}
+
+def _move_from_uci(move_str):
+    move = _MOVE_CACHE.get(move_str)
+    if move is None:
+        move = chess.Move.from_uci(move_str)
+        _MOVE_CACHE[move_str] = move
+    return move
+
 class UCIRandomEngine:
     def __init__(self):
         self.board = chess.Board()
-        
+        # Last applied position command as (base, move list) - GUIs resend
+        # the full game each move, so extensions only push the new suffix
+        self._last_position = None
+
     def get_random_move(self):
         """Get a random legal move for the side to move"""
         moves = list(self.board.legal_moves)
@@ -19,50 +33,78 @@ class UCIRandomEngine:
         
     def run(self):
         """Main UCI loop"""
-        while True:
+        # Iterate stdin's readline directly instead of calling input() per
+        # line - no prompt handling or per-call stdout flush, and the loop
+        # ends cleanly on EOF when readline returns ''
+        for line in iter(sys.stdin.readline, ''):
             try:
-                line = input().strip()
+                line = line.strip()
                 if not line:
                     continue
-                    
+
                 if line == "uci":
                     print("id name Random Opponent")
                     print("id author OpponentEngine")
-                    print("uciok")
-                    
+                    print("uciok", flush=True)
+
                 elif line == "isready":
-                    print("readyok")
-                    
+                    print("readyok", flush=True)
+
                 elif line == "ucinewgame":
-                    self.board = chess.Board()
-                    
+                    self.board.reset()
+                    self._last_position = None
+
                 elif line.startswith("position"):
                     parts = line.split()
                     if parts[1] == "startpos":
-                        self.board = chess.Board()
-                        moves_idx = 3 if len(parts) > 3 and parts[2] == "moves" else None
+                        base = "startpos"
+                        move_strs = parts[3:] if len(parts) > 3 and parts[2] == "moves" else []
                     else:  # position fen ...
                         fen_parts = []
                         i = 2
                         while i < len(parts) and parts[i] != "moves":
                             fen_parts.append(parts[i])
                             i += 1
-                        self.board = chess.Board(" ".join(fen_parts))
-                        moves_idx = i + 1 if i < len(parts) - 1 and parts[i] == "moves" else None
-                    
-                    if moves_idx:
-                        for move in parts[moves_idx:]:
-                            self.board.push(chess.Move.from_uci(move))
-                            
+                        base = " ".join(fen_parts)
+                        move_strs = parts[i + 1:] if i < len(parts) - 1 and parts[i] == "moves" else []
+
+                    # GUIs resend the whole game each move - when the new
+                    # command just extends the previous one, push only the
+                    # new suffix instead of replaying every move
+                    last = self._last_position
+                    if (last is not None and last[0] == base
+                            and len(move_strs) >= len(last[1])
+                            and move_strs[:len(last[1])] == last[1]):
+                        new_moves = move_strs[len(last[1]):]
+                    else:
+                        # Reuse the existing board - reset/set_fen rewrite
+                        # its state in place, no new Board per message
+                        if base == "startpos":
+                            self.board.reset()
+                        else:
+                            self.board.set_fen(base)
+                        new_moves = move_strs
+
+                    try:
+                        for move in new_moves:
+                            self.board.push(_move_from_uci(move))
+                    except Exception:
+                        # A half-applied command leaves the board out of
+                        # sync with the GUI - drop the cache so the next
+                        # position command rebuilds from its base instead
+                        # of extending a desynced board
+                        self._last_position = None
+                        raise
+
+                    self._last_position = (base, move_strs)
+
                 elif line.startswith("go"):
                     move = self.get_random_move()
-                    print(f"bestmove {move.uci() if move else '0000'}")
-                    
+                    print(f"bestmove {move.uci() if move else '0000'}", flush=True)
+
                 elif line == "quit":
                     break
-                    
-            except EOFError:
-                break
+
             except Exception as e:
                 print(f"info string Error: {e}", file=sys.stderr)
 